@@ -3,29 +3,47 @@
 import argparse
 import logging
 import os
-
-from .server import mcp
-from .ui import display_banner
+import sys
 
 # Configure logging level from environment
 log_level = os.getenv("HITL_LOG_LEVEL", "ERROR").upper()
+log_level_num = logging.getLevelNamesMapping().get(log_level, logging.ERROR)
 logging.basicConfig(
-    level=getattr(logging, log_level, logging.ERROR),
+    level=log_level_num,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+_UVICORN_LOG_LEVELS = {
+    logging.CRITICAL: "critical",
+    logging.ERROR: "error",
+    logging.WARNING: "warning",
+    logging.INFO: "info",
+    logging.DEBUG: "debug",
+}
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
 
 def main() -> None:
     """Run the interactive MCP server."""
     # Get defaults from environment variables
     default_host = os.getenv("HITL_HOST", "127.0.0.1")
     default_port = int(os.getenv("HITL_PORT", "5555"))
-    default_no_banner = os.getenv("HITL_NO_BANNER", "").lower() in ("1", "true", "yes")
+    default_no_banner = _env_bool("HITL_NO_BANNER")
+    force_banner = _env_bool("HITL_FORCE_BANNER")
 
     parser = argparse.ArgumentParser(
         description="Interactive MCP Server for User Input",
-        epilog="Environment variables: HITL_HOST, HITL_PORT, HITL_LOG_LEVEL, HITL_NO_BANNER",
+        epilog="Environment variables: HITL_HOST, HITL_PORT, HITL_LOG_LEVEL, HITL_NO_BANNER, HITL_FORCE_BANNER",
     )
     parser.add_argument(
         "--port", type=int, default=default_port, help=f"Port to listen on (default: {default_port})"
@@ -39,35 +57,24 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Deferred so that --help and argument errors never pay for FastMCP/Rich imports
+    from .server import mcp
+    from .ui import display_banner
+
     logger.info(f"Starting HITL MCP server on {args.host}:{args.port}")
 
-    # Display custom banner
-    if not args.no_banner:
+    # Display custom banner (rendering is skipped when nobody is watching the terminal)
+    show_banner = not args.no_banner and (force_banner or sys.stdout.isatty())
+    if show_banner:
         display_banner(host=args.host, port=args.port)
 
     try:
         # Run server with FastMCP banner disabled
-        logger.debug(f"Server configuration: host={args.host}, port={args.port}, banner={not args.no_banner}")
+        logger.debug(f"Server configuration: host={args.host}, port={args.port}, banner={show_banner}")
 
         # Configure uvicorn logging based on HITL_LOG_LEVEL
         # Only show access logs if log level is DEBUG
-        uvicorn_log_level = "error" if log_level == "ERROR" else log_level.lower()
-
-        # Configure uvicorn to disable access logs unless DEBUG
-        uvicorn_config = {}
-        if log_level != "DEBUG":
-            # Disable access logs by setting level to CRITICAL (effectively disabling them)
-            uvicorn_config = {
-                "log_config": {
-                    "version": 1,
-                    "disable_existing_loggers": False,
-                    "loggers": {
-                        "uvicorn.access": {
-                            "level": "CRITICAL",  # Disable access logs
-                        },
-                    },
-                },
-            }
+        uvicorn_log_level = _UVICORN_LOG_LEVELS.get(log_level_num, "error")
 
         mcp.run(
             transport="streamable-http",
@@ -75,7 +82,14 @@ def main() -> None:
             port=args.port,
             show_banner=False,
             log_level=uvicorn_log_level,
-            uvicorn_config=uvicorn_config if uvicorn_config else None,
+            uvicorn_config={
+                # Skip uvicorn's default handlers so its records propagate to the root logger format
+                "log_config": None,
+                # FastMCP only forwards log_level when no log_config key is given
+                "log_level": uvicorn_log_level,
+                # Access logs are only emitted at DEBUG; disabling them skips record creation per request
+                "access_log": log_level_num <= logging.DEBUG,
+            },
         )
     except KeyboardInterrupt:
         print("\n\n👋 Server stopped by user")
@@ -3,7 +3,7 @@
 import asyncio
 import re
 from collections.abc import Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +48,15 @@ def sync_to_async(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str] | None:
+    """Compile a validation pattern once, returning None if it is invalid."""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
 @sync_to_async
 def prompt_text(
     prompt: str, default: str | None = None, multiline: bool = False, validate_pattern: str | None = None
@@ -55,12 +64,12 @@ def prompt_text(
     """Prompt for text input."""
     global _needs_separator
 
+    # Compile up front; the validator runs on every submit attempt
+    pattern = _compile_pattern(validate_pattern) if validate_pattern else None
+
     def validator(text: str) -> bool:
         if validate_pattern:
-            try:
-                return bool(re.match(validate_pattern, text))
-            except re.error:
-                return False
+            return pattern is not None and pattern.match(text) is not None
         return True
 
     # Show separator if needed
@@ -20,6 +20,40 @@ def test_cli_help() -> None:
     assert "--no-banner" in result.stdout
 
 
+def test_cli_help_skips_server_import() -> None:
+    """Test --help exits before FastMCP and Rich are imported."""
+    code = (
+        "import sys\n"
+        "from hitl_mcp_cli import cli\n"
+        "sys.argv = ['hitl-mcp', '--help']\n"
+        "try:\n"
+        "    cli.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'hitl_mcp_cli.server' not in sys.modules\n"
+        "assert 'rich' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=5)
+    assert result.returncode == 0, result.stderr
+
+
+def test_env_bool() -> None:
+    """Test boolean environment flag parsing."""
+    from hitl_mcp_cli.cli import _env_bool
+
+    with patch.dict("os.environ", {}, clear=True):
+        assert _env_bool("HITL_TEST_FLAG") is False
+        assert _env_bool("HITL_TEST_FLAG", default=True) is True
+
+    for value in ("1", "true", "TRUE", " yes ", "on"):
+        with patch.dict("os.environ", {"HITL_TEST_FLAG": value}):
+            assert _env_bool("HITL_TEST_FLAG") is True
+
+    for value in ("", "0", "false", "no", "off"):
+        with patch.dict("os.environ", {"HITL_TEST_FLAG": value}):
+            assert _env_bool("HITL_TEST_FLAG", default=True) is False
+
+
 def test_banner_display() -> None:
     """Test banner displays correctly."""
     from io import StringIO
@@ -1,5 +1,9 @@
 """Integration tests for CLI module."""
 
+import logging
+import os
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -16,9 +20,9 @@ def test_cli_main_with_no_banner() -> None:
     """Test CLI main function with --no-banner flag."""
     from hitl_mcp_cli.cli import main
 
-    with patch("hitl_mcp_cli.cli.mcp.run") as mock_run:
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
         with patch("sys.argv", ["hitl-mcp", "--no-banner"]):
-            with patch("hitl_mcp_cli.cli.display_banner") as mock_banner:
+            with patch("hitl_mcp_cli.ui.display_banner") as mock_banner:
                 mock_run.side_effect = KeyboardInterrupt()  # Exit immediately
 
                 try:
@@ -31,12 +35,12 @@ def test_cli_main_with_no_banner() -> None:
 
 
 def test_cli_main_with_banner() -> None:
-    """Test CLI main function displays banner by default."""
+    """Test CLI main function displays banner by default on a terminal."""
     from hitl_mcp_cli.cli import main
 
-    with patch("hitl_mcp_cli.cli.mcp.run") as mock_run:
-        with patch("sys.argv", ["hitl-mcp"]):
-            with patch("hitl_mcp_cli.cli.display_banner") as mock_banner:
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
+        with patch("sys.argv", ["hitl-mcp"]), patch("sys.stdout.isatty", return_value=True):
+            with patch("hitl_mcp_cli.ui.display_banner") as mock_banner:
                 mock_run.side_effect = KeyboardInterrupt()
 
                 try:
@@ -48,13 +52,40 @@ def test_cli_main_with_banner() -> None:
                 mock_banner.assert_called_once()
 
 
+def test_cli_main_skips_banner_without_tty() -> None:
+    """Test CLI skips banner when stdout is not a terminal."""
+    from hitl_mcp_cli.cli import main
+
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
+        with patch("sys.argv", ["hitl-mcp"]), patch("sys.stdout.isatty", return_value=False):
+            with patch("hitl_mcp_cli.ui.display_banner") as mock_banner:
+                mock_run.side_effect = KeyboardInterrupt()
+                main()
+
+                mock_banner.assert_not_called()
+
+
+def test_cli_main_force_banner_without_tty() -> None:
+    """Test HITL_FORCE_BANNER shows banner even when stdout is not a terminal."""
+    from hitl_mcp_cli.cli import main
+
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
+        with patch("sys.argv", ["hitl-mcp"]), patch("sys.stdout.isatty", return_value=False):
+            with patch.dict("os.environ", {"HITL_FORCE_BANNER": "1"}):
+                with patch("hitl_mcp_cli.ui.display_banner") as mock_banner:
+                    mock_run.side_effect = KeyboardInterrupt()
+                    main()
+
+                    mock_banner.assert_called_once()
+
+
 def test_cli_main_with_custom_port() -> None:
     """Test CLI main function with custom port."""
     from hitl_mcp_cli.cli import main
 
-    with patch("hitl_mcp_cli.cli.mcp.run") as mock_run:
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
         with patch("sys.argv", ["hitl-mcp", "--port", "8080"]):
-            with patch("hitl_mcp_cli.cli.display_banner"):
+            with patch("hitl_mcp_cli.ui.display_banner"):
                 mock_run.side_effect = KeyboardInterrupt()
 
                 try:
@@ -71,9 +102,9 @@ def test_cli_main_with_custom_host() -> None:
     """Test CLI main function with custom host."""
     from hitl_mcp_cli.cli import main
 
-    with patch("hitl_mcp_cli.cli.mcp.run") as mock_run:
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
         with patch("sys.argv", ["hitl-mcp", "--host", "0.0.0.0"]):
-            with patch("hitl_mcp_cli.cli.display_banner"):
+            with patch("hitl_mcp_cli.ui.display_banner"):
                 mock_run.side_effect = KeyboardInterrupt()
 
                 try:
@@ -89,7 +120,7 @@ def test_cli_main_keyboard_interrupt() -> None:
     """Test CLI handles Ctrl+C gracefully."""
     from hitl_mcp_cli.cli import main
 
-    with patch("hitl_mcp_cli.cli.mcp.run") as mock_run:
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
         with patch("sys.argv", ["hitl-mcp", "--no-banner"]):
             mock_run.side_effect = KeyboardInterrupt()
             # Should not raise, just exit gracefully
@@ -100,7 +131,7 @@ def test_cli_main_generic_exception() -> None:
     """Test CLI handles generic exceptions."""
     from hitl_mcp_cli.cli import main
 
-    with patch("hitl_mcp_cli.cli.mcp.run") as mock_run:
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
         with patch("sys.argv", ["hitl-mcp", "--no-banner"]):
             with patch("hitl_mcp_cli.cli.logger") as mock_logger:
                 mock_run.side_effect = RuntimeError("Test error")
@@ -116,7 +147,7 @@ def test_cli_fastmcp_show_banner_disabled() -> None:
     """Test that FastMCP banner is disabled."""
     from hitl_mcp_cli.cli import main
 
-    with patch("hitl_mcp_cli.cli.mcp.run") as mock_run:
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
         with patch("sys.argv", ["hitl-mcp", "--no-banner"]):
             mock_run.side_effect = KeyboardInterrupt()
 
@@ -128,3 +159,38 @@ def test_cli_fastmcp_show_banner_disabled() -> None:
             # Verify show_banner=False is passed to FastMCP
             call_kwargs = mock_run.call_args[1]
             assert call_kwargs["show_banner"] is False
+
+
+def test_cli_access_log_disabled_by_default() -> None:
+    """Test uvicorn access logging is off unless HITL_LOG_LEVEL is DEBUG."""
+    from hitl_mcp_cli.cli import main
+
+    with patch("hitl_mcp_cli.server.mcp.run") as mock_run:
+        with patch("sys.argv", ["hitl-mcp", "--no-banner"]):
+            mock_run.side_effect = KeyboardInterrupt()
+            main()
+
+            call_kwargs = mock_run.call_args[1]
+            assert call_kwargs["uvicorn_config"]["access_log"] is False
+            assert call_kwargs["uvicorn_config"]["log_config"] is None
+            assert call_kwargs["uvicorn_config"]["log_level"] == "error"
+
+        with patch("sys.argv", ["hitl-mcp", "--no-banner"]):
+            with patch("hitl_mcp_cli.cli.log_level_num", logging.DEBUG):
+                main()
+
+                call_kwargs = mock_run.call_args[1]
+                assert call_kwargs["uvicorn_config"]["access_log"] is True
+
+
+def test_cli_unknown_log_level_falls_back_to_error() -> None:
+    """Test an unrecognised HITL_LOG_LEVEL resolves to ERROR."""
+    code = (
+        "import logging\n"
+        "from hitl_mcp_cli import cli\n"
+        "assert cli.log_level_num == logging.ERROR\n"
+        "assert cli._UVICORN_LOG_LEVELS[cli.log_level_num] == 'error'\n"
+    )
+    env = {**os.environ, "HITL_LOG_LEVEL": "verbose"}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=5, env=env)
+    assert result.returncode == 0, result.stderr
@@ -74,6 +74,33 @@ async def test_prompt_text_validation() -> None:
         assert validator("Invalid Slug!") is False
 
 
+@pytest.mark.asyncio
+async def test_prompt_text_invalid_pattern() -> None:
+    """Test an invalid regex pattern rejects all input instead of raising."""
+    with patch("hitl_mcp_cli.ui.prompts.inquirer.text") as mock_inquirer:
+        mock_result = MagicMock()
+        mock_result.execute.return_value = "anything"
+        mock_inquirer.return_value = mock_result
+
+        await prompt_text("Enter text:", validate_pattern=r"[unclosed")
+
+        validator = mock_inquirer.call_args[1]["validate"]
+        assert validator("anything") is False
+
+
+def test_compile_pattern_cached() -> None:
+    """Test validation patterns are compiled once and reused."""
+    from hitl_mcp_cli.ui.prompts import _compile_pattern
+
+    _compile_pattern.cache_clear()
+    _compile_pattern(r"^[a-z]+$")
+    _compile_pattern(r"^[a-z]+$")
+    info = _compile_pattern.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert _compile_pattern(r"[unclosed") is None
+
+
 @pytest.mark.asyncio
 async def test_prompt_select_basic() -> None:
     """Test single selection."""